@@ -1,12 +1,12 @@
 import logging
 from datetime import timedelta
 
-import aiohttp
 import async_timeout
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfVolume
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -35,6 +35,8 @@ class BvkDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, api_url: str) -> None:
         """Initialize."""
         self.api_url = api_url
+        # HA's shared session keeps the connection to the API alive between polls.
+        self._session = async_get_clientsession(hass)
         super().__init__(
             hass,
             _LOGGER,
@@ -46,11 +48,10 @@ class BvkDataUpdateCoordinator(DataUpdateCoordinator):
         """Fetch data from API."""
         try:
             async with async_timeout.timeout(10):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.api_url) as response:
-                        if response.status != 200:
-                            raise UpdateFailed(f"API returned status {response.status}")
-                        return await response.json()
+                async with self._session.get(self.api_url) as response:
+                    if response.status != 200:
+                        raise UpdateFailed(f"API returned status {response.status}")
+                    return await response.json()
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
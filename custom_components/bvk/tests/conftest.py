@@ -66,6 +66,18 @@ def _stub_homeassistant_modules(monkeypatch: pytest.MonkeyPatch):
     ha_helpers_entity_platform = types.ModuleType("homeassistant.helpers.entity_platform")
     ha_helpers_entity_platform.AddEntitiesCallback = object
 
+    # homeassistant.helpers.aiohttp_client
+    ha_helpers_aiohttp_client = types.ModuleType("homeassistant.helpers.aiohttp_client")
+
+    class _ClientSession:
+        def get(self, *args, **kwargs):
+            raise RuntimeError("aiohttp.ClientSession.get stubbed in tests")
+
+    def _async_get_clientsession(hass, *args, **kwargs):
+        return _ClientSession()
+
+    ha_helpers_aiohttp_client.async_get_clientsession = _async_get_clientsession
+
     # homeassistant.helpers.update_coordinator
     ha_helpers_update_coordinator = types.ModuleType("homeassistant.helpers.update_coordinator")
 
@@ -89,6 +101,7 @@ def _stub_homeassistant_modules(monkeypatch: pytest.MonkeyPatch):
         "homeassistant.const": ha_const,
         "homeassistant.core": ha_core,
         "homeassistant.components.sensor": ha_components_sensor,
+        "homeassistant.helpers.aiohttp_client": ha_helpers_aiohttp_client,
         "homeassistant.helpers.entity_platform": ha_helpers_entity_platform,
         "homeassistant.helpers.update_coordinator": ha_helpers_update_coordinator,
     }
@@ -107,21 +120,6 @@ def _stub_homeassistant_modules(monkeypatch: pytest.MonkeyPatch):
     stubs["voluptuous"] = vol
 
     # Minimal stubs for runtime deps used in sensor.py
-    aiohttp = types.ModuleType("aiohttp")
-
-    class _ClientSession:
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
-        def get(self, *args, **kwargs):
-            raise RuntimeError("aiohttp.ClientSession.get stubbed in tests")
-
-    aiohttp.ClientSession = _ClientSession
-    stubs["aiohttp"] = aiohttp
-
     async_timeout = types.ModuleType("async_timeout")
 
     class _timeout:
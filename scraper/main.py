@@ -43,6 +43,12 @@ DATA_DIR = "/app/data"
 IMAGES_DIR = os.path.join(DATA_DIR, "images")
 OCR_DEBUG_DIR = os.path.join(DATA_DIR, "ocr_debug_live")
 
+# Binarization table for the red-digit debug mask (same cutoff as the OCR engine)
+DEC_BW_LUT = [0 if px < 140 else 255 for px in range(256)]
+
+# First float-like number in a stored reading string
+READING_NUMBER_RE = re.compile(r"\d+(\.\d+)?")
+
 
 def get_driver():
     chrome_options = Options()
@@ -124,7 +130,7 @@ def validate_reading(new_reading_str):
             # Remove purely non-numeric tail if any, though our format is clean
             def parse_float(s):
                 # match first float-like pattern
-                m = re.search(r"\d+(\.\d+)?", s)
+                m = READING_NUMBER_RE.search(s)
                 if m:
                     return float(m.group(0))
                 return 0.0
@@ -328,7 +334,7 @@ def job():
             red_strength = ImageOps.autocontrast(red_strength)
             red_strength.save(os.path.join(OCR_DEBUG_DIR, "dec_red_strength.png"))
 
-            dec_bw = red_strength.point(lambda px: 0 if px < 140 else 255, "L")
+            dec_bw = red_strength.point(DEC_BW_LUT, "L")
             dec_bw.save(os.path.join(OCR_DEBUG_DIR, "dec_bw.png"))
         except Exception as dbg_err:
             logger.debug(f"Failed to generate OCR debug images: {dbg_err}")
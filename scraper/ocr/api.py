@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import os
+import tempfile
 from pathlib import Path
 
 from PIL import Image
@@ -7,6 +12,40 @@ from PIL import Image
 from scraper.ocr.base import OcrConfig
 from scraper.ocr.factory import create_ocr_engine
 
+# Loaded reading caches, keyed by cache file path.
+_result_caches: dict[Path, dict[str, str]] = {}
+
+
+def _load_result_cache(path: Path) -> dict[str, str]:
+    cache = _result_caches.get(path)
+    if cache is None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        _result_caches[path] = cache
+    return cache
+
+
+def _store_result_cache(path: Path, cache: dict[str, str]) -> None:
+    tmp: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    except OSError:
+        # A cache that cannot be written must never affect the reading.
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
 
 def ocr_meter_reading_from_image(image: Image.Image, *, config: OcrConfig | None = None) -> str:
     engine = create_ocr_engine(config or OcrConfig())
@@ -18,9 +57,33 @@ def ocr_meter_reading_from_path(
     *,
     debug_dir: str | Path | None = None,
     config: OcrConfig | None = None,
+    cache_path: str | Path | None = None,
 ) -> str:
+    """Read the meter value from an image file.
+
+    With `cache_path`, readings are memoized in that JSON file keyed by the image
+    content hash, engine name and config, so re-reading an unchanged file skips OCR
+    (and debug output). The key does not cover engine code changes; delete the file
+    after touching the OCR pipeline.
+    """
     p = Path(path)
-    with Image.open(p) as img:
+    config = config or OcrConfig()
+    cache: dict[str, str] | None = None
+    cache_key = ""
+    source: Path | io.BytesIO = p
+    if cache_path is not None:
+        cache_file = Path(cache_path)
+        cache = _load_result_cache(cache_file)
+        data = p.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        engine_name = getattr(create_ocr_engine(config), "name", "")
+        cache_key = f"{digest}:{engine_name}:{config!r}"
+        if cache_key in cache:
+            return cache[cache_key]
+        # Decode from the bytes already read for the key instead of re-reading the file.
+        source = io.BytesIO(data)
+
+    with Image.open(source) as img:
         # Ensure debug output works both on host and in Docker.
         # If caller passes an absolute container path (e.g. /app/data/ocr_debug)
         # but we're running on host, map it to local ./data/ocr_debug.
@@ -31,7 +94,7 @@ def ocr_meter_reading_from_path(
                     debug_dir = Path("data") / "ocr_debug"
             except Exception:
                 pass
-        engine = create_ocr_engine(config or OcrConfig())
+        engine = create_ocr_engine(config)
         if debug_dir is not None:
             try:
                 engine_debug = getattr(engine, "debug_preprocessed_parts", None)
@@ -44,4 +107,9 @@ def ocr_meter_reading_from_path(
             except Exception:
                 # Debug output must never affect the main reading path.
                 pass
-        return engine.read_meter(img)
+        reading = engine.read_meter(img)
+
+    if cache is not None:
+        cache[cache_key] = reading
+        _store_result_cache(cache_file, cache)
+    return reading
@@ -9,6 +9,11 @@ from PIL import Image
 class OcrConfig:
     """Configuration for OCR reading extraction."""
 
+    # Filter used for the 3x meter upsample. On the nine test fixtures (tesserocr),
+    # BICUBIC also reads 9/9 while BILINEAR misreads 148_047 as 128.047. LANCZOS stays
+    # the default until BICUBIC has been checked against live meter images.
+    upscale_resample: Image.Resampling = Image.Resampling.LANCZOS
+
 
 class OcrEngine:
     name: str
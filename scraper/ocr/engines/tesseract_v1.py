@@ -1,11 +1,309 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
+import os
+import queue
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
+import numpy as np
 import pytesseract
-from PIL import Image, ImageChops, ImageOps
+from PIL import Image, ImageChops, ImageFilter, ImageOps
+
+from scraper.ocr.base import OcrConfig, OcrEngine
+
+try:
+    import tesserocr
+except ImportError:  # pragma: no cover - optional in-process backend
+    tesserocr = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional JIT for the flood fill
+    numba = None
+
+_TESS_VARIABLES = {
+    "tessedit_char_whitelist": "0123456789",
+    "classify_bln_numeric_mode": "1",
+    "load_system_dawg": "0",
+    "load_freq_dawg": "0",
+}
+
+# Long image lists have been reported to hang tesseract; split batches above this.
+_TESS_LIST_MAX = 32
+_DIGIT_RE = re.compile(r"\d")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Idle in-process APIs. A PyTessBaseAPI must not be shared between threads, so each
+# caller checks one out; the pool grows to the peak number of concurrent readers.
+_tess_pool: queue.SimpleQueue = queue.SimpleQueue()
+_tess_api_failed = False
+
+
+def _new_tess_api():
+    global _tess_api_failed
+    try:
+        return tesserocr.PyTessBaseAPI(
+            oem=tesserocr.OEM.DEFAULT,
+            psm=tesserocr.PSM.SINGLE_CHAR,
+            variables=_TESS_VARIABLES,
+        )
+    except RuntimeError:
+        # Missing tessdata etc. - fall back to pytesseract for good instead
+        # of retrying the (slow) init on every call.
+        _tess_api_failed = True
+        return None
+
+
+@contextlib.contextmanager
+def _borrow_tess_api():
+    """Check out an in-process Tesseract API, or yield None when tesserocr is unavailable.
+
+    Keeping engines loaded avoids spawning a `tesseract` process (and re-loading
+    the language model) for every single OCR attempt.
+    """
+    if tesserocr is None or _tess_api_failed:
+        yield None
+        return
+    try:
+        api = _tess_pool.get_nowait()
+    except queue.Empty:
+        api = _new_tess_api()
+    try:
+        yield api
+    finally:
+        if api is not None:
+            _tess_pool.put(api)
+
+
+def _end_tess_apis() -> None:
+    """Release the pooled engines (registered with atexit)."""
+    while True:
+        try:
+            api = _tess_pool.get_nowait()
+        except queue.Empty:
+            return
+        api.End()
+
+
+atexit.register(_end_tess_apis)
+
+
+def _tesserocr_ready() -> bool:
+    with _borrow_tess_api() as api:
+        return api is not None
+
 
-from scraper.ocr.base import OcrEngine
+@dataclass(frozen=True, slots=True)
+class DigitStats:
+    """Pixel statistics of a single BW digit crop (ink = 0)."""
+
+    holes: int
+    black: int
+    total: int
+    left_ratio: float
+    right_ratio: float
+    top_ratio: float
+    bottom_ratio: float
+
+
+@dataclass(frozen=True, slots=True)
+class BwStats:
+    """Black-pixel counts of a BW image (ink = 0), gathered from one array."""
+
+    black: int
+    total: int
+    bbox: tuple[int, int, int, int] | None
+    top_band_black: int
+    top_band_total: int
+
+    @property
+    def top_band_ratio(self) -> float:
+        return self.top_band_black / self.top_band_total if self.top_band_total else 0.0
+
+
+def _only_digits(text: str) -> str:
+    return "".join(_DIGITS_RE.findall(text))
+
+
+def _as_mode(image: Image.Image, mode: str) -> Image.Image:
+    """Return `image` in `mode`, skipping the copy when it is already there."""
+    return image if image.mode == mode else image.convert(mode)
+
+
+def _as_l_array(image: Image.Image) -> np.ndarray:
+    """Grayscale pixels of `image` as uint8, without a PIL conversion for L/1 input."""
+    if image.mode == "L":
+        return np.asarray(image)
+    if image.mode == "1":
+        return np.asarray(image).astype(np.uint8) * 255
+    return np.asarray(image.convert("L"))
+
+
+@functools.cache
+def _threshold_lut(cutoff: int) -> tuple[int, ...]:
+    """256-entry binarization table for `Image.point` (ink below `cutoff` -> 0)."""
+    return tuple(0 if px < cutoff else 255 for px in range(256))
+
+
+def _binarize_np(a: np.ndarray, *, cutoff: int) -> np.ndarray:
+    # bool * uint8 stays uint8; np.where(..., 0, 255) would build an int64 array first.
+    return (a >= cutoff) * np.uint8(255)
+
+
+def _binarize_padded(image: Image.Image, *, cutoff: int, border: int = 50) -> Image.Image:
+    """Threshold at `cutoff` straight into a white canvas with a `border` margin."""
+    a = _as_l_array(image)
+    h, w = a.shape
+    out = np.full((h + 2 * border, w + 2 * border), 255, dtype=np.uint8)
+    np.multiply(a >= cutoff, np.uint8(255), out=out[border : border + h, border : border + w])
+    return Image.fromarray(out, "L")
+
+
+def _fix_border_artifacts_np(a: np.ndarray) -> np.ndarray:
+    """Trim a 6% margin and re-pad with 30 px of white (array version)."""
+    h, w = a.shape
+    margin = max(1, int(min(w, h) * 0.06))
+    inner = a[margin : h - margin, margin : w - margin]
+    ih, iw = inner.shape
+    out = np.full((ih + 60, iw + 60), 255, dtype=np.uint8)
+    out[30 : 30 + ih, 30 : 30 + iw] = inner
+    return out
+
+
+def _erase_border_band_np(a: np.ndarray, *, band_px: int, inplace: bool = False) -> np.ndarray:
+    """Paint a white frame of `band_px` over the array edges (array version).
+
+    Pass `inplace=True` only for a writable array the caller owns and no longer needs.
+    """
+    if band_px <= 0:
+        return a
+    h, w = a.shape
+    band_px = min(band_px, (min(w, h) // 2) - 1)
+    if band_px <= 0:
+        return a
+    out = a if inplace else a.copy()
+    out[:band_px, :] = 255
+    out[h - band_px :, :] = 255
+    out[:, :band_px] = 255
+    out[:, w - band_px :] = 255
+    return out
+
+
+def _bbox_np(a: np.ndarray) -> tuple[int, int, int, int] | None:
+    """NumPy equivalent of `Image.getbbox()`: bounds of the non-zero pixels."""
+    mask = a != 0
+    if mask.ndim == 3:
+        mask = mask.any(axis=2)
+    rows = mask.any(axis=1)
+    if not rows.any():
+        return None
+    cols = mask.any(axis=0)
+    top = int(rows.argmax())
+    bottom = len(rows) - int(rows[::-1].argmax())
+    left = int(cols.argmax())
+    right = len(cols) - int(cols[::-1].argmax())
+    return left, top, right, bottom
+
+
+def _padded_bbox(a: np.ndarray, *, pad_px: int) -> tuple[int, int, int, int] | None:
+    bbox = _bbox_np(a)
+    if bbox is None:
+        return None
+    h, w = a.shape[:2]
+    left, top, right, bottom = bbox
+    return (
+        max(0, left - pad_px),
+        max(0, top - pad_px),
+        min(w, right + pad_px),
+        min(h, bottom + pad_px),
+    )
+
+
+def _crop_np_to_ink(a: np.ndarray, *, pad_px: int) -> np.ndarray | None:
+    """Array counterpart of `_crop_to_ink`: a padded view of the non-zero pixels."""
+    box = _padded_bbox(a, pad_px=pad_px)
+    if box is None:
+        return None
+    x0, y0, x1, y1 = box
+    return a[y0:y1, x0:x1]
+
+
+def _flood_kernel(white, visited, stack, top, w):
+    # Pixels are encoded as y * w + x; each one is pushed at most once.
+    h = white.shape[0]
+    while top > 0:
+        top -= 1
+        cy, cx = divmod(stack[top], w)
+        for ny, nx in ((cy, cx - 1), (cy, cx + 1), (cy - 1, cx), (cy + 1, cx)):
+            if 0 <= nx < w and 0 <= ny < h and white[ny, nx] and not visited[ny, nx]:
+                visited[ny, nx] = True
+                stack[top] = ny * w + nx
+                top += 1
+
+
+def _count_holes_kernel(white):
+    h, w = white.shape
+    visited = np.zeros((h, w), dtype=np.bool_)
+    stack = np.empty(h * w, dtype=np.int64)
+    top = 0
+    for x in range(w):
+        for y in (0, h - 1):
+            if white[y, x] and not visited[y, x]:
+                visited[y, x] = True
+                stack[top] = y * w + x
+                top += 1
+    for y in range(h):
+        for x in (0, w - 1):
+            if white[y, x] and not visited[y, x]:
+                visited[y, x] = True
+                stack[top] = y * w + x
+                top += 1
+    _flood_kernel(white, visited, stack, top, w)
+
+    holes = 0
+    for y in range(h):
+        for x in range(w):
+            if white[y, x] and not visited[y, x]:
+                holes += 1
+                visited[y, x] = True
+                stack[0] = y * w + x
+                _flood_kernel(white, visited, stack, 1, w)
+    return holes
+
+
+def _borderless_bw_kernel(a, band_px, cutoff):
+    # Fused _erase_border_band_np + _binarize_np: one pass, one allocation.
+    h, w = a.shape
+    out = np.empty((h, w), dtype=np.uint8)
+    for y in range(h):
+        edge_row = y < band_px or y >= h - band_px
+        for x in range(w):
+            if edge_row or x < band_px or x >= w - band_px or a[y, x] >= cutoff:
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
+    return out
+
+
+if numba is not None:
+    _flood_kernel = numba.njit(cache=True)(_flood_kernel)
+    _count_holes_kernel = numba.njit(cache=True)(_count_holes_kernel)
+    _borderless_bw_kernel = numba.njit(cache=True)(_borderless_bw_kernel)
+
+
+def _borderless_bw_np(a: np.ndarray, *, band_px: int, cutoff: int) -> np.ndarray:
+    """Erase the border band and binarize at `cutoff` (ink -> 0)."""
+    if numba is None:
+        # The band is white either way, so erase it on the fresh binarized copy.
+        return _erase_border_band_np(_binarize_np(a, cutoff=cutoff), band_px=band_px, inplace=True)
+    h, w = a.shape
+    band_px = max(0, min(band_px, (min(w, h) // 2) - 1))
+    return _borderless_bw_kernel(a, band_px, cutoff)
 
 
 class TesseractV1Engine(OcrEngine):
@@ -13,38 +311,45 @@ class TesseractV1Engine(OcrEngine):
 
     name = "tesseract_v1"
 
-    def _preprocess_meter_image(self, image: Image.Image) -> tuple[Image.Image, Image.Image]:
-        # Grayscale
-        image = image.convert("L")
+    def __init__(self, config: OcrConfig | None = None) -> None:
+        self.config = config or OcrConfig()
 
-        # Resize for better OCR stability
+    def _upscale3(self, image: Image.Image) -> Image.Image:
         width, height = image.size
-        image = image.resize((width * 3, height * 3), Image.Resampling.LANCZOS)
+        return image.resize((width * 3, height * 3), self.config.upscale_resample)
+
+    def _upscaled_gray(self, image: Image.Image) -> Image.Image:
+        # Grayscale + resize for better OCR stability
+        return self._upscale3(_as_mode(image, "L"))
+
+    def _preprocess_meter_image(
+        self, image: Image.Image, *, gray3: Image.Image | None = None
+    ) -> tuple[Image.Image, Image.Image]:
+        image = gray3 if gray3 is not None else self._upscaled_gray(image)
 
         # Split where the decimals start (tuned empirically)
         split_x = int(image.width * 0.65)
         left_part = image.crop((0, 0, split_x, image.height))
         right_part = image.crop((split_x, 0, image.width, image.height))
 
-        # Integers: invert + contrast + threshold
-        left_part = ImageOps.invert(left_part)
-        left_part = ImageOps.autocontrast(left_part)
-        left_part = left_part.point(lambda x: 0 if x < 150 else 255, "L")
-
-        # Decimals: contrast + threshold
+        # Integers: invert + contrast; decimals: contrast only
+        left_part = ImageOps.autocontrast(ImageOps.invert(left_part))
         right_part = ImageOps.autocontrast(right_part)
-        right_part = right_part.point(lambda x: 0 if x < 150 else 255, "L")
 
-        # Pad to help Tesseract handle edge glyphs
-        left_padded = ImageOps.expand(left_part, border=50, fill=255)
-        right_padded = ImageOps.expand(right_part, border=50, fill=255)
+        # Threshold and pad to help Tesseract handle edge glyphs
+        left_padded = _binarize_padded(left_part, cutoff=150)
+        right_padded = _binarize_padded(right_part, cutoff=150)
 
         return left_padded, right_padded
 
-    def _preprocess_left_variants(self, image: Image.Image) -> list[Image.Image]:
-        gray = image.convert("L")
-        width, height = gray.size
-        gray = gray.resize((width * 3, height * 3), Image.Resampling.LANCZOS)
+    def _preprocess_left_variants(
+        self,
+        image: Image.Image,
+        *,
+        gray3: Image.Image | None = None,
+        cutoffs: tuple[int, ...] = (120, 150, 180),
+    ) -> list[Image.Image]:
+        gray = gray3 if gray3 is not None else self._upscaled_gray(image)
         split_x = int(gray.width * 0.65)
         left = gray.crop((0, 0, split_x, gray.height))
 
@@ -52,93 +357,91 @@ class TesseractV1Engine(OcrEngine):
         inv = ImageOps.autocontrast(inv)
 
         variants: list[Image.Image] = []
-        for cutoff in (120, 150, 180):
-            thr = inv.point(lambda x: 0 if x < cutoff else 255, "L")
-            variants.append(ImageOps.expand(thr, border=50, fill=255))
+        for cutoff in cutoffs:
+            variants.append(_binarize_padded(inv, cutoff=cutoff))
 
         direct = ImageOps.autocontrast(left)
-        direct = direct.point(lambda x: 0 if x < 120 else 255, "L")
-        variants.append(ImageOps.expand(direct, border=50, fill=255))
+        variants.append(_binarize_padded(direct, cutoff=120))
 
         return variants
 
     def debug_preprocessed_parts(self, image: Image.Image) -> tuple[Image.Image, Image.Image]:
         return self._preprocess_meter_image(image)
 
-    def _ocr_digits(self, image: Image.Image, *, psm: int) -> str:
-        cfg = (
+    def _tesseract_config(self, psm: int) -> str:
+        return (
             f"--oem 3 --psm {psm} "
             "-c tessedit_char_whitelist=0123456789 "
             "-c classify_bln_numeric_mode=1 "
             "-c load_system_dawg=0 -c load_freq_dawg=0"
         )
-        return pytesseract.image_to_string(image, config=cfg).strip()
-
-    def _threshold(self, image: Image.Image, *, cutoff: int) -> Image.Image:
-        return image.point(lambda px: 0 if px < cutoff else 255, "L")
-
-    def _erase_border_band(self, image: Image.Image, *, band_px: int) -> Image.Image:
-        if band_px <= 0:
-            return image
-        w, h = image.size
-        band_px = min(band_px, (min(w, h) // 2) - 1)
-        if band_px <= 0:
-            return image
-
-        img = image.copy()
-        px = img.load()
-        if px is None:
-            return image
 
-        for x in range(w):
-            for y in range(band_px):
-                px[x, y] = 255
-            for y in range(h - band_px, h):
-                px[x, y] = 255
-
-        for y in range(h):
-            for x in range(band_px):
-                px[x, y] = 255
-            for x in range(w - band_px, w):
-                px[x, y] = 255
+    def _ocr_digits(self, image: Image.Image, *, psm: int) -> str:
+        with _borrow_tess_api() as api:
+            if api is not None:
+                api.SetPageSegMode(psm)
+                api.SetImage(image)
+                return api.GetUTF8Text().strip()
+
+        return pytesseract.image_to_string(image, config=self._tesseract_config(psm)).strip()
+
+    def _ocr_digits_batch(self, images: list[Image.Image], *, psm: int) -> list[str]:
+        """OCR several images with the same psm, one result per image.
+
+        Without tesserocr, the images are handed to a single `tesseract` run via an
+        image-list file, which reads each one as its own page with the same config
+        (one process and model load instead of one per image).
+        """
+        if len(images) <= 1 or _tesserocr_ready():
+            return [self._ocr_digits(image, psm=psm) for image in images]
+        if len(images) > _TESS_LIST_MAX:
+            return [
+                text
+                for i in range(0, len(images), _TESS_LIST_MAX)
+                for text in self._ocr_digits_batch(images[i : i + _TESS_LIST_MAX], psm=psm)
+            ]
 
-        return img
+        with tempfile.TemporaryDirectory(prefix="bvk_ocr_") as tmp:
+            paths = []
+            for idx, image in enumerate(images):
+                path = os.path.join(tmp, f"{idx}.png")
+                image.save(path)
+                paths.append(path)
+            list_path = os.path.join(tmp, "images.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(paths) + "\n")
+            out = pytesseract.image_to_string(list_path, config=self._tesseract_config(psm))
+
+        # Pages are split by form feeds: 4.x ends every page with one, 5.x only puts
+        # page_separator between pages. Either way page i is pages[i]; a trailing
+        # empty piece (4.x) is dropped by the slice.
+        pages = out.split("\f")
+        if len(pages) < len(images):
+            return [self._ocr_digits(image, psm=psm) for image in images]
+        return [page.strip() for page in pages[: len(images)]]
 
     def _thicken_strokes(self, image: Image.Image) -> Image.Image:
-        w, h = image.size
-        up = image.resize((w * 2, h * 2), Image.Resampling.NEAREST)
-        return up.resize((w, h), Image.Resampling.NEAREST)
+        return self._thicken_strokes_n(image, n=1)
 
     def _thicken_strokes_n(self, image: Image.Image, *, n: int) -> Image.Image:
+        # Dark ink on white: a 3x3 min filter grows strokes by one pixel per pass.
         out = image
         for _ in range(max(0, n)):
-            out = self._thicken_strokes(out)
+            out = out.filter(ImageFilter.MinFilter(3))
         return out
 
     def _crop_to_ink(self, image: Image.Image, *, pad_px: int = 6) -> Image.Image | None:
-        bbox = image.getbbox()
-        if bbox is None:
+        box = _padded_bbox(np.asarray(image), pad_px=pad_px)
+        if box is None:
             return None
-        w, h = image.size
-        left, top, right, bottom = bbox
-        left = max(0, left - pad_px)
-        top = max(0, top - pad_px)
-        right = min(w, right + pad_px)
-        bottom = min(h, bottom + pad_px)
-        return image.crop((left, top, right, bottom))
-
-    def _to_bw(self, image: Image.Image, *, cutoff: int) -> Image.Image:
-        gray = image.convert("L")
-        thr = gray.point(lambda px: 0 if px < cutoff else 255, "L")
-        return thr.convert("1")
+        return image.crop(box)
 
     def _extract_red_ink_bw(self, image: Image.Image) -> Image.Image:
         """Extract red digits into a BW mask."""
 
-        rgb = image.convert("RGB")
-
-        w, h = rgb.size
-        dec = rgb.crop((int(w * 0.65), 0, w, h))
+        # Crop before converting: only the decimal third needs RGB pixels.
+        w, h = image.size
+        dec = _as_mode(image.crop((int(w * 0.65), 0, w, h)), "RGB")
         dw, dh = dec.size
         dec = dec.resize((dw * 8, dh * 8), Image.Resampling.LANCZOS)
 
@@ -147,14 +450,7 @@ class TesseractV1Engine(OcrEngine):
         red_strength = ImageChops.subtract(r, avg_gb, scale=0.5)
         red_strength = ImageOps.autocontrast(red_strength)
 
-        bw = red_strength.point(lambda px: 0 if px < 140 else 255, "L")
-        return bw.convert("1")
-
-    def _fix_border_artifacts(self, image: Image.Image) -> Image.Image:
-        w, h = image.size
-        margin = max(1, int(min(w, h) * 0.06))
-        cropped = image.crop((margin, margin, w - margin, h - margin))
-        return ImageOps.expand(cropped, border=30, fill=255)
+        return red_strength.point(_threshold_lut(140), "L")
 
     def _ocr_digits_scaled(self, image: Image.Image, *, psm: int, scale: int) -> str:
         if scale <= 1:
@@ -169,39 +465,25 @@ class TesseractV1Engine(OcrEngine):
         canvas = Image.new("L", (side, side), 255)
         x = (side - w) // 2
         y = (side - h) // 2
-        canvas.paste(image.convert("L"), (x, y))
+        canvas.paste(_as_mode(image, "L"), (x, y))
         return canvas
 
     def _split_into_digit_regions(
         self, bw: Image.Image, *, expected_digits: int = 3
     ) -> list[Image.Image]:
-        img = bw.convert("1")
+        img = _as_mode(bw, "L")
         w, h = img.size
-        px = img.load()
-        if px is None or w <= expected_digits:
+        if w <= expected_digits:
             return [img]
 
-        ink = []
-        for x in range(w):
-            c = 0
-            for y in range(h):
-                if px[x, y] == 0:
-                    c += 1
-            ink.append(c)
+        arr = np.asarray(img)
+        # Ink pixels per column.
+        ink = np.count_nonzero(arr == 0, axis=0)
 
         threshold = max(1, int(h * 0.01))
-        is_ink = [c >= threshold for c in ink]
-
-        runs: list[tuple[int, int]] = []
-        start = None
-        for x, flag in enumerate(is_ink):
-            if flag and start is None:
-                start = x
-            elif not flag and start is not None:
-                runs.append((start, x))
-                start = None
-        if start is not None:
-            runs.append((start, w))
+        # Runs of ink columns as [start, end) pairs from the edges of the padded mask.
+        edges = np.flatnonzero(np.diff(np.pad(ink >= threshold, 1).astype(np.int8)))
+        runs = list(zip(edges[::2].tolist(), edges[1::2].tolist(), strict=True))
 
         min_run = max(2, int(w * 0.02))
         merged: list[tuple[int, int]] = []
@@ -217,7 +499,7 @@ class TesseractV1Engine(OcrEngine):
             else:
                 merged.append((a, b))
 
-        bbox = img.getbbox()
+        bbox = _bbox_np(arr)
         if bbox is None:
             return [img]
         bbox_left, _top, bbox_right, _bottom = bbox
@@ -236,13 +518,13 @@ class TesseractV1Engine(OcrEngine):
                     x1 = left + ((i + 1) * step) if i < (expected_digits - 1) else right
                     boxes.append((x0, x1))
             else:
-                region = ink[left:right]
-                win = 7
-                smooth = []
-                for i in range(len(region)):
-                    a = max(0, i - (win // 2))
-                    b = min(len(region), i + (win // 2) + 1)
-                    smooth.append(sum(region[a:b]) / (b - a))
+                region = ink[left:right].astype(np.float64)
+                # Moving average over the available part of the window (edges use
+                # fewer samples rather than zero padding).
+                kernel = np.ones(7)
+                sums = np.convolve(region, kernel, mode="same")
+                counts = np.convolve(np.ones_like(region), kernel, mode="same")
+                smooth = sums / counts
 
                 idx1_start = int(len(smooth) * 0.20)
                 idx1_end = int(len(smooth) * 0.45)
@@ -251,10 +533,9 @@ class TesseractV1Engine(OcrEngine):
 
                 def argmin(a: int, b: int) -> int:
                     sub = smooth[a:b]
-                    if not sub:
+                    if not sub.size:
                         return a
-                    m = min(sub)
-                    return a + sub.index(m)
+                    return a + int(sub.argmin())
 
                 cut1 = argmin(idx1_start, idx1_end)
                 cut2 = argmin(idx2_start, idx2_end)
@@ -277,98 +558,63 @@ class TesseractV1Engine(OcrEngine):
         return crops
 
     def _invert_bw(self, image: Image.Image) -> Image.Image:
-        lum = image.convert("L")
-        inv = ImageOps.invert(lum)
-        return inv.convert("1")
-
-    def _bw_black_pixel_stats(self, bw: Image.Image) -> tuple[int, int]:
-        img = bw.convert("1")
-        w, h = img.size
-        px = img.load()
-        if px is None:
-            return 0, w * h
-        black = 0
-        for y in range(h):
-            for x in range(w):
-                if px[x, y] == 0:
-                    black += 1
-        return black, w * h
+        return ImageOps.invert(_as_mode(image, "L"))
+
+    def _bw_stats(self, bw: Image.Image, *, band_ratio: float = 0.15) -> BwStats:
+        """Black-pixel counts of a BW image and of the top band of its content box."""
+        ink = _as_l_array(bw) == 0
+        bbox = _bbox_np(~ink)
+        band_black = band_total = 0
+        if bbox is not None:
+            left, top, right, bottom = bbox
+            band_h = max(1, int((bottom - top) * band_ratio))
+            band_total = (right - left) * band_h
+            band_black = int(np.count_nonzero(ink[top : top + band_h, left:right]))
+        return BwStats(
+            black=int(np.count_nonzero(ink)),
+            total=ink.size,
+            bbox=bbox,
+            top_band_black=band_black,
+            top_band_total=band_total,
+        )
 
-    def _bw_top_band_black_ratio(self, bw: Image.Image, *, band_ratio: float = 0.15) -> float:
-        img = bw.convert("1")
-        w, h = img.size
-        band_h = max(1, int(h * band_ratio))
-        px = img.load()
-        if px is None:
-            return 0.0
-        black = 0
-        total = w * band_h
-        for y in range(band_h):
-            for x in range(w):
-                if px[x, y] == 0:
-                    black += 1
-        return black / total if total else 0.0
-
-    def _bw_top_band_black_ratio_of_ink(
-        self, bw: Image.Image, *, band_ratio: float = 0.15
-    ) -> float:
-        img = bw.convert("1")
-        cropped = self._crop_to_ink(img, pad_px=0)
-        if cropped is None:
-            return 0.0
-        return self._bw_top_band_black_ratio(cropped, band_ratio=band_ratio)
+    def _digit_stats(self, part: Image.Image) -> DigitStats:
+        """Collect all ratios used by the digit heuristics in a single pass."""
+        ink = _as_l_array(part) == 0
+        h, w = ink.shape
+        black = int(ink.sum())
+        left_ratio = right_ratio = top_ratio = bottom_ratio = 0.0
+        if w > 1 and h > 1:
+            mid_x = w // 2
+            mid_y = h // 2
+            left_black = int(ink[:, :mid_x].sum())
+            top_black = int(ink[:mid_y, :].sum())
+            left_ratio = left_black / (mid_x * h)
+            right_ratio = (black - left_black) / ((w - mid_x) * h)
+            top_ratio = top_black / (w * mid_y)
+            bottom_ratio = (black - top_black) / (w * (h - mid_y))
+        return DigitStats(
+            holes=self._count_white_holes(part),
+            black=black,
+            total=w * h,
+            left_ratio=left_ratio,
+            right_ratio=right_ratio,
+            top_ratio=top_ratio,
+            bottom_ratio=bottom_ratio,
+        )
 
-    def _bw_left_right_black_ratio(self, bw: Image.Image) -> tuple[float, float]:
-        img = bw.convert("1")
+    def _count_white_holes(self, bw: Image.Image) -> int:
+        img = _as_mode(bw, "L")
         w, h = img.size
-        px = img.load()
-        if px is None or w <= 1 or h <= 1:
-            return 0.0, 0.0
-        mid = w // 2
-        left_black = 0
-        right_black = 0
-        left_total = mid * h
-        right_total = (w - mid) * h
-        for y in range(h):
-            for x in range(w):
-                if px[x, y] == 0:
-                    if x < mid:
-                        left_black += 1
-                    else:
-                        right_black += 1
-        left_ratio = left_black / left_total if left_total else 0.0
-        right_ratio = right_black / right_total if right_total else 0.0
-        return left_ratio, right_ratio
+        if w <= 1 or h <= 1:
+            return 0
 
-    def _bw_top_bottom_black_ratio(self, bw: Image.Image) -> tuple[float, float]:
-        img = bw.convert("1")
-        w, h = img.size
-        px = img.load()
-        if px is None or w <= 1 or h <= 1:
-            return 0.0, 0.0
-        mid = h // 2
-        top_black = 0
-        bottom_black = 0
-        top_total = w * mid
-        bottom_total = w * (h - mid)
-        for y in range(h):
-            for x in range(w):
-                if px[x, y] == 0:
-                    if y < mid:
-                        top_black += 1
-                    else:
-                        bottom_black += 1
-        top_ratio = top_black / top_total if top_total else 0.0
-        bottom_ratio = bottom_black / bottom_total if bottom_total else 0.0
-        return top_ratio, bottom_ratio
+        if numba is not None:
+            return int(_count_holes_kernel(np.asarray(img) != 0))
 
-    def _count_white_holes(self, bw: Image.Image) -> int:
-        img = bw.convert("1")
-        w, h = img.size
         px = img.load()
-        if px is None or w <= 1 or h <= 1:
+        if px is None:
             return 0
-
         visited = [[False] * w for _ in range(h)]
 
         def is_white(x: int, y: int) -> bool:
@@ -404,217 +650,209 @@ class TesseractV1Engine(OcrEngine):
                     flood(x, y)
         return holes
 
-    def _read_decimal_split(self, right_img: Image.Image) -> tuple[str, int]:
-        fixed = self._fix_border_artifacts(right_img)
-        band = max(2, int(min(fixed.size) * 0.05))
-        borderless = self._erase_border_band(fixed, band_px=band)
-        bw = self._to_bw(borderless, cutoff=200)
+    def _read_decimal_split_bw(self, bw: Image.Image) -> tuple[str, int]:
+        """Split the cutoff-200 borderless decimal mask into digits and read each one."""
         cropped = self._crop_to_ink(bw, pad_px=10)
         if cropped is None:
             return "", 0
 
         parts = self._split_into_digit_regions(cropped, expected_digits=3)
-        digits = []
-        detected = 0
-        for idx, part in enumerate(parts):
-            black, total = self._bw_black_pixel_stats(part)
-            if total and (black / total) > 0.55:
-                part = self._invert_bw(part)
-            cropped_part = self._crop_to_ink(part, pad_px=12)
-            if cropped_part is not None:
-                part = cropped_part
-            part = self._thicken_strokes_n(part, n=2)
-            part_l = part.convert("L")
-            w, h = part.size
-            ratio = (w / h) if h else 0.0
-            digit = ""
+        # Each digit needs up to four tesseract runs; both the pytesseract subprocesses
+        # and the pooled tesserocr APIs (which release the GIL) overlap in threads.
+        with ThreadPoolExecutor(max_workers=max(1, len(parts))) as pool:
+            results = list(pool.map(self._read_split_digit, range(len(parts)), parts))
+        digits = "".join(digit for digit, _ in results)
+        detected = sum(1 for _, found in results if found)
+        return digits, detected
+
+    def _read_split_digit(self, idx: int, part: Image.Image) -> tuple[str, bool]:
+        """Read one region from `_split_into_digit_regions`; returns (digit, detected)."""
+        bw_stats = self._bw_stats(part)
+        if bw_stats.total and (bw_stats.black / bw_stats.total) > 0.55:
+            part = self._invert_bw(part)
+        cropped_part = self._crop_to_ink(part, pad_px=12)
+        if cropped_part is not None:
+            part = cropped_part
+        part = self._thicken_strokes_n(part, n=2)
+        part_l = _as_mode(part, "L")
+        w, h = part.size
+        ratio = (w / h) if h else 0.0
+        digit = ""
+        for scale in (3, 4):
+            s = self._ocr_digits_scaled(
+                self._pad_to_square(part_l, pad=30),
+                psm=10,
+                scale=scale,
+            )
+            d = _only_digits(s)
+            if d:
+                digit = d[:1]
+                break
+        if not digit:
+            inv_l = _as_mode(self._invert_bw(part), "L")
             for scale in (3, 4):
                 s = self._ocr_digits_scaled(
-                    self._pad_to_square(part_l, pad=30),
+                    self._pad_to_square(inv_l, pad=30),
                     psm=10,
                     scale=scale,
                 )
-                d = "".join(re.findall(r"\d+", s))
+                d = _only_digits(s)
                 if d:
                     digit = d[:1]
                     break
-            if not digit:
-                inv_l = self._invert_bw(part).convert("L")
-                for scale in (3, 4):
-                    s = self._ocr_digits_scaled(
-                        self._pad_to_square(inv_l, pad=30),
-                        psm=10,
-                        scale=scale,
-                    )
-                    d = "".join(re.findall(r"\d+", s))
-                    if d:
-                        digit = d[:1]
-                        break
-            holes = self._count_white_holes(part)
-            if digit == "5" and holes == 0:
-                left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
-                top_ratio, bottom_ratio = self._bw_top_bottom_black_ratio(part)
-                if left_ratio > right_ratio * 1.5 and top_ratio > bottom_ratio * 1.15:
-                    digit = "9"
-            if holes >= 2 and digit == "5":
-                digit = ""
-            if digit == "1" and ratio >= 0.35:
-                digit = ""
-            if digit == "2" and holes == 1:
-                left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
+        stats = self._digit_stats(part)
+        holes = stats.holes
+        left_ratio, right_ratio = stats.left_ratio, stats.right_ratio
+        top_ratio, bottom_ratio = stats.top_ratio, stats.bottom_ratio
+        if digit == "5" and holes == 0:
+            if left_ratio > right_ratio * 1.5 and top_ratio > bottom_ratio * 1.15:
+                digit = "9"
+        if holes >= 2 and digit == "5":
+            digit = ""
+        if digit == "1" and ratio >= 0.35:
+            digit = ""
+        if digit == "2" and holes == 1:
+            if right_ratio > left_ratio * 1.2:
+                digit = "9"
+            elif left_ratio > right_ratio * 1.2:
+                digit = "6"
+            else:
+                digit = "0"
+        if digit == "3" and holes == 1:
+            if abs(left_ratio - right_ratio) < 0.03:
+                digit = "0"
+        detected = bool(digit)
+        if idx == 0 and not digit:
+            bw_stats = self._bw_stats(part)
+            if (
+                bw_stats.total
+                and (bw_stats.black / bw_stats.total) > 0.03
+                and bw_stats.top_band_ratio > 0.06
+            ):
+                digit = "7"
+        if not digit:
+            if ratio > 0 and ratio < 0.35:
+                diff_tb = abs(top_ratio - bottom_ratio)
+                if holes >= 1:
+                    if abs(left_ratio - right_ratio) < 0.03:
+                        if diff_tb > 0.03:
+                            digit = "0"
+                        elif diff_tb < 0.02:
+                            digit = "8"
+                if not digit:
+                    if top_ratio > bottom_ratio * 1.15:
+                        digit = "7"
+                    else:
+                        digit = "1"
+            elif holes >= 2:
+                digit = "8"
+            elif holes == 1:
                 if right_ratio > left_ratio * 1.2:
-                    digit = "9"
-                elif left_ratio > right_ratio * 1.2:
-                    digit = "6"
-                else:
-                    digit = "0"
-            if digit == "3" and holes == 1:
-                left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
-                if abs(left_ratio - right_ratio) < 0.03:
-                    digit = "0"
-            if digit:
-                detected += 1
-            if idx == 0 and not digit:
-                black, total = self._bw_black_pixel_stats(part)
-                top_ratio = self._bw_top_band_black_ratio_of_ink(part)
-                if total and (black / total) > 0.03 and top_ratio > 0.06:
-                    digit = "7"
-            if not digit:
-                if ratio > 0 and ratio < 0.35:
-                    top_ratio, bottom_ratio = self._bw_top_bottom_black_ratio(part)
-                    left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
                     diff_tb = abs(top_ratio - bottom_ratio)
-                    if holes >= 1:
-                        if abs(left_ratio - right_ratio) < 0.03:
-                            if diff_tb > 0.03:
-                                digit = "0"
-                            elif diff_tb < 0.02:
-                                digit = "8"
-                    if not digit:
-                        if top_ratio > bottom_ratio * 1.15:
-                            digit = "7"
-                        else:
-                            digit = "1"
-                elif holes >= 2:
-                    digit = "8"
-                elif holes == 1:
-                    left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
-                    top_ratio, bottom_ratio = self._bw_top_bottom_black_ratio(part)
-                    if right_ratio > left_ratio * 1.2:
-                        diff_tb = abs(top_ratio - bottom_ratio)
-                        if diff_tb < 0.006:
-                            digit = "1"
-                        elif diff_tb < 0.02:
-                            digit = "5"
-                        else:
-                            digit = "9"
-                    elif left_ratio > right_ratio * 1.2:
-                        if abs(top_ratio - bottom_ratio) < 0.02:
-                            digit = "6"
-                        else:
-                            digit = "0"
+                    if diff_tb < 0.006:
+                        digit = "1"
+                    elif diff_tb < 0.02:
+                        digit = "5"
+                    else:
+                        digit = "9"
+                elif left_ratio > right_ratio * 1.2:
+                    if abs(top_ratio - bottom_ratio) < 0.02:
+                        digit = "6"
                     else:
                         digit = "0"
                 else:
-                    left_ratio, right_ratio = self._bw_left_right_black_ratio(part)
-                    top_ratio, bottom_ratio = self._bw_top_bottom_black_ratio(part)
-                    if right_ratio > left_ratio * 1.5 and abs(top_ratio - bottom_ratio) < 0.02:
-                        digit = "3"
-                    elif top_ratio > bottom_ratio * 1.15:
-                        digit = "7"
-            if not digit:
-                digit = "0"
-            digits.append(digit)
-        return "".join(digits), detected
+                    digit = "0"
+            else:
+                if right_ratio > left_ratio * 1.5 and abs(top_ratio - bottom_ratio) < 0.02:
+                    digit = "3"
+                elif top_ratio > bottom_ratio * 1.15:
+                    digit = "7"
+        if not digit:
+            digit = "0"
+        return digit, detected
 
     def read_meter(self, image: Image.Image) -> str:
-        left_img, right_img = self._preprocess_meter_image(image)
-
-        text_int = self._ocr_digits(left_img, psm=7)
+        # Grayscale 3x upsample shared by every preprocessing variant below.
+        gray3 = self._upscaled_gray(image)
+        left_img, right_img = self._preprocess_meter_image(image, gray3=gray3)
 
         def has_3_digits(s: str) -> bool:
-            return len("".join(re.findall(r"\d+", s))) >= 3
-
-        text_dec = self._ocr_digits(right_img, psm=7)
-        if not re.search(r"\d", text_dec):
-            text_dec = self._ocr_digits(right_img, psm=8)
-        if not re.search(r"\d", text_dec):
-            text_dec = self._ocr_digits(self._fix_border_artifacts(right_img), psm=7)
-        if not re.search(r"\d", text_dec):
-            text_dec = self._ocr_digits(self._fix_border_artifacts(right_img), psm=8)
-        if not re.search(r"\d", text_dec):
-            relaxed = self._threshold(self._fix_border_artifacts(right_img), cutoff=190)
-            text_dec = self._ocr_digits(relaxed, psm=7)
-        if not re.search(r"\d", text_dec):
-            relaxed = self._threshold(self._fix_border_artifacts(right_img), cutoff=190)
-            text_dec = self._ocr_digits(relaxed, psm=8)
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            text_dec = self._ocr_digits_scaled(fixed, psm=7, scale=3)
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            text_dec = self._ocr_digits_scaled(fixed, psm=8, scale=3)
-        if not re.search(r"\d", text_dec):
-            fixed = self._threshold(self._fix_border_artifacts(right_img), cutoff=190)
-            text_dec = self._ocr_digits_scaled(fixed, psm=7, scale=3)
-        if not re.search(r"\d", text_dec):
-            fixed = self._threshold(self._fix_border_artifacts(right_img), cutoff=190)
-            text_dec = self._ocr_digits_scaled(fixed, psm=8, scale=3)
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            band = max(2, int(min(fixed.size) * 0.05))
-            borderless = self._erase_border_band(fixed, band_px=band)
-            borderless = self._thicken_strokes(borderless)
-            text_dec = self._ocr_digits_scaled(borderless, psm=7, scale=3)
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            band = max(2, int(min(fixed.size) * 0.05))
-            borderless = self._erase_border_band(fixed, band_px=band)
-            borderless = self._thicken_strokes(borderless)
-            text_dec = self._ocr_digits_scaled(borderless, psm=8, scale=3)
-
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            band = max(2, int(min(fixed.size) * 0.05))
-            borderless = self._erase_border_band(fixed, band_px=band)
-            bw = self._to_bw(borderless, cutoff=200)
-            cropped = self._crop_to_ink(bw, pad_px=10)
+            return len(_only_digits(s)) >= 3
+
+        split_result: tuple[str, int] | None = None
+        red_bw: Image.Image | None = None
+
+        def decimal_split() -> tuple[str, int]:
+            # The digit split is the most expensive fallback; run it at most once.
+            nonlocal split_result
+            if split_result is None:
+                split_result = self._read_decimal_split_bw(Image.fromarray(bw_a, "L"))
+            return split_result
+
+        def red_ink_bw() -> Image.Image:
+            nonlocal red_bw
+            if red_bw is None:
+                red_bw = self._extract_red_ink_bw(image)
+            return red_bw
+
+        # Every decimal fallback below is a view of the same border-fixed array; build
+        # them once instead of re-cropping/re-padding PIL images in each branch.
+        fixed_a = _fix_border_artifacts_np(_as_l_array(right_img))
+        band = max(2, int(min(fixed_a.shape) * 0.05))
+        borderless_a = _erase_border_band_np(fixed_a, band_px=band)
+        bw_a = _borderless_bw_np(fixed_a, band_px=band, cutoff=200)
+        cropped_a = _crop_np_to_ink(bw_a, pad_px=10)
+        fixed = Image.fromarray(fixed_a, "L")
+        relaxed = Image.fromarray(_binarize_np(fixed_a, cutoff=190), "L")
+        borderless = self._thicken_strokes(Image.fromarray(borderless_a, "L"))
+        cropped = Image.fromarray(cropped_a, "L") if cropped_a is not None else None
+
+        # (image, psm, scale) tried in order until one yields a digit.
+        stages = (
+            (right_img, 7, 1),
+            (right_img, 8, 1),
+            (fixed, 7, 1),
+            (fixed, 8, 1),
+            (relaxed, 7, 1),
+            (relaxed, 8, 1),
+            (fixed, 7, 3),
+            (fixed, 8, 3),
+            (relaxed, 7, 3),
+            (relaxed, 8, 3),
+            (borderless, 7, 3),
+            (borderless, 8, 3),
+        )
+        text_dec = ""
+        for stage_img, psm, scale in stages:
+            text_dec = self._ocr_digits_scaled(stage_img, psm=psm, scale=scale)
+            if _DIGIT_RE.search(text_dec):
+                break
+
+        if not _DIGIT_RE.search(text_dec):
             if cropped is not None:
-                text_dec = self._ocr_digits_scaled(cropped.convert("L"), psm=13, scale=3)
+                text_dec = self._ocr_digits_scaled(cropped, psm=13, scale=3)
         if not has_3_digits(text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            band = max(2, int(min(fixed.size) * 0.05))
-            borderless = self._erase_border_band(fixed, band_px=band)
-            bw = self._to_bw(borderless, cutoff=200)
-            cropped = self._crop_to_ink(bw, pad_px=10)
             if cropped is not None:
-                padded = self._pad_to_square(cropped.convert("L"), pad=30)
+                padded = self._pad_to_square(cropped, pad=30)
                 text_dec = self._ocr_digits_scaled(padded, psm=10, scale=4)
 
         if not has_3_digits(text_dec):
-            red_bw = self._extract_red_ink_bw(image)
-            red_cropped = self._crop_to_ink(red_bw, pad_px=12)
-            red_base = red_cropped if red_cropped is not None else red_bw
-            text_dec = self._ocr_digits_scaled(red_base.convert("L"), psm=7, scale=3)
+            red_cropped = self._crop_to_ink(red_ink_bw(), pad_px=12)
+            red_base = red_cropped if red_cropped is not None else red_ink_bw()
+            text_dec = self._ocr_digits_scaled(_as_mode(red_base, "L"), psm=7, scale=3)
 
         if not has_3_digits(text_dec):
-            alt_dec, _detected = self._read_decimal_split(right_img)
+            alt_dec, _detected = decimal_split()
             if alt_dec:
                 text_dec = alt_dec
-        if not re.search(r"\d", text_dec):
-            fixed = self._fix_border_artifacts(right_img)
-            band = max(2, int(min(fixed.size) * 0.05))
-            borderless = self._erase_border_band(fixed, band_px=band)
-            bw = self._to_bw(borderless, cutoff=200)
-            cropped = self._crop_to_ink(bw, pad_px=10)
+        if not _DIGIT_RE.search(text_dec):
             if cropped is not None:
-                text_dec = self._ocr_digits_scaled(cropped.convert("L"), psm=6, scale=3)
+                text_dec = self._ocr_digits_scaled(cropped, psm=6, scale=3)
 
         red_dec = ""
         try:
-            red_bw = self._extract_red_ink_bw(image)
-            red_text = self._ocr_digits_scaled(red_bw.convert("L"), psm=7, scale=3)
-            red_dec = "".join(re.findall(r"\d+", red_text))
+            red_text = self._ocr_digits_scaled(_as_mode(red_ink_bw(), "L"), psm=7, scale=3)
+            red_dec = _only_digits(red_text)
         except Exception:
             red_dec = ""
 
@@ -622,7 +860,7 @@ class TesseractV1Engine(OcrEngine):
         left_candidates: list[tuple[int, int, str]] = []
 
         def add_candidate(text: str, *, left: bool = False) -> None:
-            digits = "".join(re.findall(r"\d+", text))
+            digits = _only_digits(text)
             if not digits:
                 return
             sig_len = len(digits.lstrip("0"))
@@ -631,22 +869,21 @@ class TesseractV1Engine(OcrEngine):
             if left:
                 left_candidates.append(entry)
 
-        add_candidate(text_int, left=True)
-        for variant in self._preprocess_left_variants(image):
-            add_candidate(self._ocr_digits(variant, psm=7), left=True)
-            add_candidate(self._ocr_digits(variant, psm=8), left=True)
-        for psm in (6, 8):
-            add_candidate(self._ocr_digits(left_img, psm=psm), left=True)
-
+        # All integer-part candidates are unconditional; OCR them grouped by psm so the
+        # pytesseract path needs one tesseract run per psm.
+        # The inverted cutoff-150 variant is pixel-identical to left_img, so OCR left_img
+        # once per psm and count its reading for both.
+        variants = self._preprocess_left_variants(image, gray3=gray3, cutoffs=(120, 180))
         thick = self._thicken_strokes(left_img)
-        add_candidate(self._ocr_digits(thick, psm=7), left=True)
-
-        full = image.convert("L")
-        w, h = full.size
-        full = full.resize((w * 3, h * 3), Image.Resampling.LANCZOS)
-        full = ImageOps.autocontrast(full)
-        full = full.point(lambda x: 0 if x < 150 else 255, "L")
-        full = ImageOps.expand(full, border=50, fill=255)
+        texts = self._ocr_digits_batch([left_img, *variants, thick], psm=7)
+        for text in (texts[0], *texts):
+            add_candidate(text, left=True)
+        texts = self._ocr_digits_batch([left_img, *variants], psm=8)
+        for text in (texts[0], *texts):
+            add_candidate(text, left=True)
+        add_candidate(self._ocr_digits(left_img, psm=6), left=True)
+
+        full = _binarize_padded(ImageOps.autocontrast(gray3), cutoff=150)
         add_candidate(self._ocr_digits(full, psm=8))
 
         int_digits = ""
@@ -684,14 +921,14 @@ class TesseractV1Engine(OcrEngine):
                 int_digits = candidates[0][2]
 
         val_int = int_digits.lstrip("0") or "0"
-        val_dec = "".join(re.findall(r"\d+", text_dec))
+        val_dec = _only_digits(text_dec)
 
         if len(val_dec) > 3:
             val_dec = val_dec[:3]
         if not val_dec:
             val_dec = "0"
 
-        alt_dec, detected = self._read_decimal_split(right_img)
+        alt_dec, detected = decimal_split()
         if alt_dec and (len(val_dec) < 3 or (detected >= 2 and alt_dec != val_dec)):
             val_dec = alt_dec
 
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import functools
+
 from scraper.ocr.base import OcrConfig, OcrEngine
 from scraper.ocr.engines.tesseract_v1 import TesseractV1Engine
 
 
-def create_ocr_engine(_cfg: OcrConfig | None = None) -> OcrEngine:
-    return TesseractV1Engine()
+@functools.cache
+def _get_engine(cfg: OcrConfig) -> OcrEngine:
+    # Engines hold no per-read state, so one instance per (frozen) config is enough.
+    return TesseractV1Engine(cfg)
+
+
+def create_ocr_engine(cfg: OcrConfig | None = None) -> OcrEngine:
+    return _get_engine(cfg or OcrConfig())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+
+# Parallel runs already use every core; keep each tesseract engine to one OpenMP
+# thread so workers x OMP threads does not oversubscribe the CPU. Must be set before
+# the OCR engine (and tesserocr) is imported by the test modules.
+if os.environ.get("OCR_PARALLEL") == "1" or "PYTEST_XDIST_WORKER" in os.environ:
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import pytesseract  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def tesseract_version() -> str:
+    """Probe the tesseract binary once per session instead of once per image."""
+    try:
+        return str(pytesseract.get_tesseract_version())
+    except Exception as err:
+        raise RuntimeError("tesseract is required for scraper tests") from err
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """Print the per-image OCR table for the parametrized resource test."""
+
+    rows: list[tuple[str, str, str, str]] = []
+    for outcome in ("passed", "failed"):
+        for report in terminalreporter.stats.get(outcome, []):
+            if getattr(report, "when", None) != "call":
+                continue
+            props = dict(report.user_properties)
+            if "ocr_expected" not in props:
+                continue
+            image = report.nodeid.rsplit("[", 1)[-1].rstrip("]")
+            status = "OK" if report.passed else "FAIL"
+            rows.append((status, image, props["ocr_expected"], props.get("ocr_actual", "")))
+    if not rows:
+        return
+    rows.sort(key=lambda r: r[1])
+
+    headers = ("STATUS", "IMAGE", "EXPECTED", "ACTUAL")
+    widths = [len(h) for h in headers]
+    for r in rows:
+        for i, cell in enumerate(r):
+            widths[i] = max(widths[i], len(cell))
+
+    def fmt_row(values: tuple[str, str, str, str]) -> str:
+        return " | ".join(v.ljust(widths[i]) for i, v in enumerate(values))
+
+    failed_cnt = sum(1 for r in rows if r[0] != "OK")
+    terminalreporter.write_line("")
+    terminalreporter.write_line(fmt_row(headers))
+    terminalreporter.write_line("-+-".join("-" * w for w in widths))
+    for r in rows:
+        ok = r[0] == "OK"
+        terminalreporter.write_line(fmt_row(r), green=ok, red=not ok)
+    terminalreporter.write_line("")
+    terminalreporter.write_line(f"Total images: {len(rows)}")
+    terminalreporter.write_line(f"Passed: {len(rows) - failed_cnt}", green=True)
+    terminalreporter.write_line(f"Failed: {failed_cnt}", green=failed_cnt == 0, red=failed_cnt != 0)
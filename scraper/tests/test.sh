@@ -5,6 +5,9 @@ echo "Rebuilding scraper image..."
 docker compose build scraper
 
 echo "Running OCR tests"
+# Extra arguments go to pytest, e.g. `-n auto` to spread the images over workers.
+# xdist workers run tesseract with OMP_THREAD_LIMIT=1 (see conftest.py), so the
+# worker count alone should match the CPU count.
 docker compose run --rm \
   scraper \
-  python -m pytest -q scraper/tests
+  python -m pytest -q scraper/tests "$@"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from scraper.ocr import api
+from scraper.ocr.base import OcrConfig
+from scraper.ocr.engines.tesseract_v1 import TesseractV1Engine
+
+
+@pytest.fixture
+def read_calls(monkeypatch: pytest.MonkeyPatch) -> list[OcrConfig]:
+    """Stub out OCR (no tesseract needed) and record each read_meter call."""
+
+    calls: list[OcrConfig] = []
+
+    def fake_read_meter(self: TesseractV1Engine, image: Image.Image) -> str:
+        calls.append(self.config)
+        return f"{100 + len(calls)}.000"
+
+    monkeypatch.setattr(TesseractV1Engine, "read_meter", fake_read_meter)
+    # Start every test with no cache files loaded.
+    monkeypatch.setattr(api, "_result_caches", {})
+    return calls
+
+
+@pytest.fixture
+def image_path(tmp_path: Path) -> Path:
+    path = tmp_path / "meter.png"
+    Image.new("RGB", (40, 20), "white").save(path)
+    return path
+
+
+def test_cache_hit_skips_read_meter(
+    read_calls: list[OcrConfig], image_path: Path, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / "cache.json"
+
+    first = api.ocr_meter_reading_from_path(image_path, cache_path=cache_path)
+    assert cache_path.exists()
+
+    # Drop the in-memory copy so the hit has to come from the file.
+    api._result_caches.clear()
+    second = api.ocr_meter_reading_from_path(image_path, cache_path=cache_path)
+
+    assert second == first
+    assert len(read_calls) == 1
+
+
+def test_cache_misses_for_different_config(
+    read_calls: list[OcrConfig], image_path: Path, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / "cache.json"
+    other = OcrConfig(upscale_resample=Image.Resampling.BICUBIC)
+
+    first = api.ocr_meter_reading_from_path(image_path, cache_path=cache_path)
+    second = api.ocr_meter_reading_from_path(image_path, config=other, cache_path=cache_path)
+
+    assert second != first
+    assert read_calls == [OcrConfig(), other]
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]"], ids=["corrupt", "not-a-dict"])
+def test_bad_cache_file_falls_back_to_ocr(
+    read_calls: list[OcrConfig], image_path: Path, tmp_path: Path, content: str
+) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text(content, encoding="utf-8")
+
+    assert api.ocr_meter_reading_from_path(image_path, cache_path=cache_path) == "101.000"
+    assert len(read_calls) == 1
+
+
+def test_unwritable_cache_falls_back_to_ocr(
+    read_calls: list[OcrConfig], image_path: Path, tmp_path: Path
+) -> None:
+    # The cache's parent is a regular file, so neither mkdir nor the write can succeed.
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    cache_path = blocker / "cache.json"
+
+    assert api.ocr_meter_reading_from_path(image_path, cache_path=cache_path) == "101.000"
+    assert len(read_calls) == 1
+    assert sorted(tmp_path.iterdir()) == sorted([blocker, image_path])
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from scraper.ocr.engines import tesseract_v1
+from scraper.ocr.engines.tesseract_v1 import TesseractV1Engine
+
+
+def _page_text(image: Image.Image) -> str:
+    # Every stub image has a distinct width, so it doubles as the recognised text.
+    return str(image.width)
+
+
+def _tess4_output(texts: list[str]) -> str:
+    # Tesseract 4.x: every page is terminated by a form feed.
+    return "".join(f"{t}\n\f" for t in texts)
+
+
+def _tess5_output(texts: list[str]) -> str:
+    # Tesseract 5.x: page_separator only goes between pages.
+    return "\f".join(f"{t}\n" for t in texts)
+
+
+def _short_output(texts: list[str]) -> str:
+    return _tess5_output(texts[:-1])
+
+
+@pytest.fixture
+def list_runs(monkeypatch: pytest.MonkeyPatch) -> Callable[[Callable[[list[str]], str]], list[int]]:
+    """Force the pytesseract backend and stub tesseract; returns an installer.
+
+    The installer takes a formatter for image-list output and returns the list of
+    image-list runs, each recorded as the number of images in the list.
+    """
+
+    def install(fmt: Callable[[list[str]], str]) -> list[int]:
+        runs: list[int] = []
+
+        def fake_image_to_string(image, config=""):
+            if isinstance(image, str):
+                with open(image, encoding="utf-8") as f:
+                    paths = f.read().split()
+                runs.append(len(paths))
+                texts = []
+                for path in paths:
+                    with Image.open(path) as page:
+                        texts.append(_page_text(page))
+                return fmt(texts)
+            return _page_text(image) + "\n"
+
+        monkeypatch.setattr(tesseract_v1, "tesserocr", None)
+        monkeypatch.setattr(tesseract_v1.pytesseract, "image_to_string", fake_image_to_string)
+        return runs
+
+    return install
+
+
+def _images(n: int) -> list[Image.Image]:
+    return [Image.new("L", (10 + i, 8), 255) for i in range(n)]
+
+
+@pytest.mark.parametrize("fmt", [_tess4_output, _tess5_output], ids=["tess4", "tess5"])
+def test_batch_splits_image_list_output(list_runs, fmt) -> None:
+    runs = list_runs(fmt)
+    images = _images(3)
+
+    texts = TesseractV1Engine()._ocr_digits_batch(images, psm=7)
+
+    assert texts == [_page_text(im) for im in images]
+    assert runs == [3]
+
+
+def test_batch_retries_per_image_when_pages_are_missing(list_runs) -> None:
+    runs = list_runs(_short_output)
+    images = _images(3)
+
+    texts = TesseractV1Engine()._ocr_digits_batch(images, psm=7)
+
+    assert texts == [_page_text(im) for im in images]
+    assert runs == [3]
+
+
+def test_batch_chunks_long_image_lists(list_runs) -> None:
+    runs = list_runs(_tess5_output)
+    images = _images(tesseract_v1._TESS_LIST_MAX + 8)
+
+    texts = TesseractV1Engine()._ocr_digits_batch(images, psm=7)
+
+    assert texts == [_page_text(im) for im in images]
+    assert runs == [tesseract_v1._TESS_LIST_MAX, 8]
+
+
+def _random_masks(seed: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    masks = []
+    for h, w in ((2, 2), (2, 9), (7, 3), (12, 12), (25, 18), (40, 31)):
+        for density in (0.2, 0.45, 0.7):
+            masks.append(rng.random((h, w)) < density)
+    return masks
+
+
+def _hole_kernels() -> list:
+    # The plain-Python kernel always; its numba-compiled form too when installed.
+    kernel = tesseract_v1._count_holes_kernel
+    py_func = getattr(kernel, "py_func", kernel)
+    return [py_func] if py_func is kernel else [py_func, kernel]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_count_holes_kernel_matches_python_flood_fill(
+    monkeypatch: pytest.MonkeyPatch, seed: int
+) -> None:
+    engine = TesseractV1Engine()
+    kernels = _hole_kernels()
+    for white in _random_masks(seed):
+        image = Image.fromarray(white.astype(np.uint8) * 255, "L")
+        with monkeypatch.context() as m:
+            m.setattr(tesseract_v1, "numba", None)
+            expected = engine._count_white_holes(image)
+        for kernel in kernels:
+            assert int(kernel(white)) == expected, white.shape
+
+
+def _borderless_kernels() -> list:
+    kernel = tesseract_v1._borderless_bw_kernel
+    py_func = getattr(kernel, "py_func", kernel)
+    return [py_func] if py_func is kernel else [py_func, kernel]
+
+
+@pytest.mark.parametrize("shape", [(2, 2), (3, 5), (4, 4), (9, 6), (20, 31)])
+@pytest.mark.parametrize("band_px", [-2, 0, 1, 3, 50])
+def test_borderless_kernel_matches_numpy_path(
+    monkeypatch: pytest.MonkeyPatch, shape: tuple[int, int], band_px: int
+) -> None:
+    a = np.random.default_rng(band_px + 100 * shape[0]).integers(0, 256, shape, dtype=np.uint8)
+    for cutoff in (1, 128, 200, 255):
+        with monkeypatch.context() as m:
+            m.setattr(tesseract_v1, "numba", None)
+            expected = tesseract_v1._borderless_bw_np(a, band_px=band_px, cutoff=cutoff)
+        # Route through the kernel branch (including its band clamping) for each variant.
+        for kernel in _borderless_kernels():
+            with monkeypatch.context() as m:
+                m.setattr(tesseract_v1, "numba", tesseract_v1.numba or object())
+                m.setattr(tesseract_v1, "_borderless_bw_kernel", kernel)
+                actual = tesseract_v1._borderless_bw_np(a, band_px=band_px, cutoff=cutoff)
+            np.testing.assert_array_equal(actual, expected)